@@ -5,26 +5,247 @@ Python port of https://github.com/KrumpetPirate/AAXtoMP3
 """
 
 import argparse
+import asyncio
+import base64
+import concurrent.futures
+import csv
+import functools
+import hashlib
+import importlib
 import json
 import logging
 import os
 import re
+import shlex
 import shutil
+import string
 import subprocess
 import sys
 import tempfile
-from typing import Optional, Dict, List
+import threading
+from typing import Optional, Dict, List, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional, faster parsing of ffprobe and voucher JSON
+    _json_loads = json.loads
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Linux can enlarge a pipe's kernel buffer; Python only names the option from 3.10
+_F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031 if sys.platform.startswith('linux') else None)
+# Pipe and read buffer size for streamed ffmpeg output
+_PIPE_SIZE = 1 << 20
+
+# Container tags the converter reads, present in the metadata dict even
+# when the source lacks them
+_METADATA_TAGS = ('title', 'artist', 'album', 'album_artist', 'date', 'genre', 'copyright')
+
+# Metadata dict entries that describe the file rather than tag it, and so
+# are not written to the output
+_DERIVED_FIELDS = ('bitrate', 'duration', 'narrator', 'publisher')
+
+# ffprobe fields read by the converter: book tags, duration and bitrate,
+# each stream's type, and chapter times and titles
+_PROBE_ENTRIES = ':'.join((
+    'format=duration,bit_rate', 'format_tags',
+    'stream=codec_type',
+    'chapter=start_time,end_time', 'chapter_tags',
+))
+
+# Characters that are invalid in filenames, all mapped to an underscore
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Spaces after initials, as in "C. S. Lewis"
+_INITIALS_RE = re.compile(r'\.\s+')
+
+# Characters with special meaning in ffmetadata files, escaped with a backslash
+_FFMETADATA_ESCAPES = str.maketrans({c: '\\' + c for c in '=;#\\\n'})
+
+# Lets subprocess start children with posix_spawn instead of fork and exec,
+# which it only does when no descriptors need closing and the executable
+# is given with its path. Python opens files non-inheritable, so nothing
+# leaks into the child. Windows has no posix_spawn, and there close_fds=False
+# would let concurrent children inherit each other's pipe handles.
+_SPAWN = {'close_fds': False} if os.name == 'posix' else {}
+
+# Output redirection for ffmpeg runs whose stdout is never read; only the
+# (short, -loglevel error) stderr is kept for error reporting
+_QUIET = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE, **_SPAWN}
+
+
+# mutagen modules used to tag files in-process (optional)
+_MUTAGEN_MODULES = ('mutagen', 'mutagen.flac', 'mutagen.id3', 'mutagen.oggopus')
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy(name: str):
+    """Import a module on first use, or return None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _mutagen():
+    """Return mutagen with the submodules used here, or None if it is not installed.
+
+    mutagen is only imported once a file needs tagging or checking, which
+    keeps it out of runs such as --help that never use it.
+    """
+    if all(_lazy(name) for name in _MUTAGEN_MODULES):
+        return _lazy('mutagen')
+    return None
+
+
+class _NamingScheme(string.Template):
+    """Template for the -D, -F and --chapter-naming-scheme options.
+
+    Only the known variable names are matched, longest first, so a variable
+    may be followed directly by any text, as in '$artist_$title', and
+    $chapternum is never taken for $chapter followed by "num".
+    """
+    idpattern = r'chapternum|chapter|title|artist|genre'
+    flags = 0  # Variable names are case sensitive
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_binary(name: str, path: Optional[str] = None) -> Tuple[str, bool]:
+    """Return the command for an external tool and whether it can be found.
+
+    A tool that is found is returned with its full path, which lets
+    subprocess use posix_spawn for it. Lookups are cached, so converters
+    built in the same process share them.
+    """
+    command = os.path.join(path, name) if path else name
+    resolved = shutil.which(command)
+    return (resolved, True) if resolved else (command, False)
+
+
+def _grow_pipe(pipe):
+    """Enlarge a pipe's kernel buffer where the platform supports it."""
+    if fcntl is None or _F_SETPIPE_SZ is None:
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, _PIPE_SIZE)
+    except OSError:
+        pass  # Over the system's pipe size limit; keep the default
+
+
+def _output_tags(metadata: Dict[str, str]) -> List[Tuple[str, str]]:
+    """Return the metadata entries that are written to the output as tags."""
+    return [(key, value) for key, value in metadata.items()
+            if value and key not in _DERIVED_FIELDS]
+
+
+def _file_size(path: str) -> int:
+    """Return the size of a file, or 0 if it cannot be read."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0  # Reported as missing when the file is converted
+
+
+def _authcode_cache_path() -> str:
+    """Return the path of the file that remembers authcodes between runs."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'aaxtomp3', 'authcodes.json')
+
+
+def _load_authcodes() -> Dict[str, str]:
+    """Read the remembered authcodes, keyed by file fingerprint."""
+    try:
+        with open(_authcode_cache_path(), 'rb') as f:
+            authcodes = _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return authcodes if isinstance(authcodes, dict) else {}
+
+
+def _file_fingerprint(path: str) -> Optional[str]:
+    """Identify a file by a hash of its first MiB, or return None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read(1 << 20)).hexdigest()
+    except OSError:
+        return None
+
+
+# Converter owned by a file worker process, built once by _init_worker
+_worker_converter = None
+
+
+def _init_worker_logging(log_queue, level):
+    """Route a worker process's log records to the parent through a queue."""
+    import logging.handlers
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    # Spawned workers start with a fresh logging configuration
+    root.setLevel(level)
+
+
+def _init_worker(log_queue, level, options, tools):
+    """Set up a file worker process with its own converter."""
+    global _worker_converter
+    _init_worker_logging(log_queue, level)
+    _worker_converter = AAXConverter(argparse.Namespace(**options), tools)
+
+
+def _convert_in_worker(aax_file):
+    """Convert one file with the worker process's converter."""
+    _worker_converter.convert_file(aax_file)
 
 
 class AAXConverter:
     """Main class for converting AAX/AAXC files to various audio formats."""
 
-    def __init__(self, args):
-        """Initialize the converter with command-line arguments."""
+    # Option that takes --level for each encoder
+    _CODEC_FLAGS = {
+        'libmp3lame': ('-q:a',),
+        'flac': ('-compression_level',),
+        'libopus': ('-compression_level',),
+    }
+
+    # Attributes set by validate_dependencies, handed to file workers
+    _TOOL_ATTRS = ('ffmpeg', '_ffmpeg_prefix', 'ffprobe', 'mp4art', 'has_mp4art',
+                   'mp4chaps', 'has_mp4chaps', 'mediainfo', 'has_mediainfo')
+
+    def __init__(self, args, tools: Optional[Dict[str, object]] = None):
+        """Initialize the converter with command-line arguments.
+
+        File workers pass the tools found by the parent's converter, so the
+        lookups and their warnings are not repeated in every worker.
+        """
         self.args = args
+        # Never start more workers than there are files to convert
+        self.file_jobs = max(1, min(self.args.jobs, len(self.args.files)))
+        # Printed commands must come out whole and in file order
+        if self.args.dry_run:
+            self.file_jobs = 1
+        # Share the remaining job budget between the chapters of each file
+        self.chapter_jobs = max(1, self.args.jobs // self.file_jobs)
+        # Interleaved progress bars from parallel workers are unreadable
+        self.show_progress_bar = self.args.loglevel < 2 and self.file_jobs == 1
+        # Parsed ffprobe output, keyed by absolute input path
+        self._probe_cache = {}
+        # Keep the demuxer's stream analysis short before every input
+        self._fast_input_flags = ['-analyzeduration', '1M', '-probesize', '1M']
+        # Naming schemes are parsed once and only filled in per book or chapter
+        self._dir_template = self._compile_scheme(self.args.dir_naming_scheme)
+        self._file_template = self._compile_scheme(self.args.file_naming_scheme)
+        self._chapter_template = self._compile_scheme(self.args.chapter_naming_scheme)
         self.setup_logging()
         self.setup_codec()
-        self.validate_dependencies()
+        if tools is None:
+            self.validate_dependencies()
+        else:
+            vars(self).update(tools)
 
     def setup_logging(self):
         """Configure logging based on log level."""
@@ -43,7 +264,9 @@ class AAXConverter:
             log_format = '%(message)s'
             date_format = None
             
-        logging.basicConfig(level=level, format=log_format, datefmt=date_format, stream=sys.stdout)
+        # Keep log lines out of the commands printed by --dry-run
+        stream = sys.stderr if self.args.dry_run else sys.stdout
+        logging.basicConfig(level=level, format=log_format, datefmt=date_format, stream=stream)
         self.logger = logging.getLogger(__name__)
 
     def setup_codec(self):
@@ -81,14 +304,23 @@ class AAXConverter:
             self.mode = self.args.mode
             self.container = 'mp3'
 
+        # The codec, quality and format arguments are fixed for the life of
+        # the converter, so build them once instead of for every ffmpeg run
+        if self.codec == 'copy':
+            self._codec_args = ('-c:a', 'copy')
+        else:
+            quality = ()
+            if self.args.level > -1:
+                quality = tuple(a for flag in self._CODEC_FLAGS.get(self.codec, ())
+                                for a in (flag, str(self.args.level)))
+            self._codec_args = ('-c:a', self.codec, *quality)
+        self._fmt_args = ('-f', self.container)
+
     def validate_dependencies(self):
         """Validate that required external tools are available."""
         # Check for ffmpeg
-        self.ffmpeg = self.args.ffmpeg_name
-        if self.args.ffmpeg_path:
-            self.ffmpeg = os.path.join(self.args.ffmpeg_path, self.args.ffmpeg_name)
-        
-        if not shutil.which(self.ffmpeg):
+        self.ffmpeg, found = _resolve_binary(self.args.ffmpeg_name, self.args.ffmpeg_path)
+        if not found:
             self.logger.error(f"ERROR: {self.ffmpeg} was not found on your PATH")
             self.logger.error("Installation instructions:")
             self.logger.error("  MacOS:   brew install ffmpeg")
@@ -96,13 +328,11 @@ class AAXConverter:
             self.logger.error("  RHEL:    yum install ffmpeg")
             self.logger.error("  Windows: https://www.ffmpeg.org/download.html#build-windows")
             sys.exit(1)
+        self._ffmpeg_prefix = (self.ffmpeg, '-nostats', '-loglevel', 'error')
 
         # Check for ffprobe
-        self.ffprobe = self.args.ffprobe_name
-        if self.args.ffmpeg_path:
-            self.ffprobe = os.path.join(self.args.ffmpeg_path, self.args.ffprobe_name)
-        
-        if not shutil.which(self.ffprobe):
+        self.ffprobe, found = _resolve_binary(self.args.ffprobe_name, self.args.ffmpeg_path)
+        if not found:
             self.logger.error(f"ERROR: {self.ffprobe} was not found on your PATH")
             self.logger.error("Installation instructions:")
             self.logger.error("  MacOS:   brew install ffmpeg")
@@ -111,39 +341,63 @@ class AAXConverter:
             self.logger.error("  Windows: https://www.ffmpeg.org/download.html#build-windows")
             sys.exit(1)
 
-        # Set up mp4art and mp4chaps paths
-        self.mp4art = self.args.mp4art_name
-        if self.args.mp4art_path:
-            self.mp4art = os.path.join(self.args.mp4art_path, self.args.mp4art_name)
-        
-        self.mp4chaps = self.args.mp4chaps_name
-        if self.args.mp4chaps_path:
-            self.mp4chaps = os.path.join(self.args.mp4chaps_path, self.args.mp4chaps_name)
-
-        # Set up mediainfo path
-        self.mediainfo = self.args.mediainfo_name
-        if self.args.mediainfo_path:
-            self.mediainfo = os.path.join(self.args.mediainfo_path, self.args.mediainfo_name)
-
-        # Check for optional tools
+        # Check for optional tools once; the results are reused for every file
+        self.mp4art, self.has_mp4art = _resolve_binary(self.args.mp4art_name, self.args.mp4art_path)
+        self.mp4chaps, self.has_mp4chaps = _resolve_binary(self.args.mp4chaps_name, self.args.mp4chaps_path)
+        self.mediainfo, self.has_mediainfo = _resolve_binary(self.args.mediainfo_name,
+                                                             self.args.mediainfo_path)
         if self.container == 'mp4':
-            if not shutil.which(self.mp4art):
+            if not self.has_mp4art:
                 self.logger.warning(f"WARN: {self.mp4art} was not found on your PATH")
                 self.logger.warning("  MacOS:   brew install mp4v2")
                 self.logger.warning("  Ubuntu:  sudo apt-get install mp4v2-utils")
                 self.logger.warning("  Windows:  Source available at https://github.com/enzo1982/mp4v2/releases")
             
-            if not shutil.which(self.mp4chaps):
+            if not self.has_mp4chaps:
                 self.logger.warning(f"WARN: {self.mp4chaps} was not found on your PATH")
                 self.logger.warning("  MacOS:   brew install mp4v2")
                 self.logger.warning("  Ubuntu:  sudo apt-get install mp4v2-utils")
                 self.logger.warning("  Windows:  Source available at https://github.com/enzo1982/mp4v2/releases")
 
-        # Check for mediainfo (optional)
-        self.has_mediainfo = shutil.which(self.mediainfo) is not None
+    async def _run(self, cmd: List[str]) -> Tuple[int, str, str]:
+        """Run a command without blocking the event loop and return (returncode, stdout, stderr)."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, **_SPAWN
+        )
+        stdout, stderr = await proc.communicate()
+        return (proc.returncode, stdout.decode('utf-8', errors='replace'),
+                stderr.decode('utf-8', errors='replace'))
+
+    async def _ffprobe_all(self, aax_file: str, decrypt_param: List[str]) -> Optional[Dict]:
+        """Probe format, streams and chapters of a file in a single ffprobe run.
+
+        The parsed JSON is cached so that validation, metadata, chapter and
+        cover art extraction all share one ffprobe invocation per file. Only
+        the fields those readers use are requested, which keeps the output
+        small for books with hundreds of chapters.
+        """
+        path = os.path.abspath(aax_file)
+        if path in self._probe_cache:
+            return self._probe_cache[path]
+
+        data = None
+        try:
+            cmd = [self.ffprobe, '-loglevel', 'error', '-print_format', 'json',
+                   '-show_entries', _PROBE_ENTRIES] + decrypt_param + self._fast_input_flags + ['-i', path]
+            returncode, stdout, stderr = await self._run(cmd)
 
-    def validate_aax_file(self, aax_file: str, decrypt_param: List[str]) -> bool:
-        """Validate an AAX/AAXC file."""
+            if returncode == 0:
+                data = _json_loads(stdout)
+            else:
+                self.logger.debug(stderr)
+        except Exception as e:
+            self.logger.debug(f"ffprobe failed on {aax_file}: {e}")
+
+        self._probe_cache[path] = data
+        return data
+
+    async def validate_aax_file_fast(self, aax_file: str, decrypt_param: List[str]) -> bool:
+        """Check that an AAX/AAXC file exists and that its header can be probed."""
         # Test for existence
         if not os.path.isfile(aax_file):
             self.logger.error(f"ERROR: File NOT Found: {aax_file}")
@@ -153,80 +407,66 @@ class AAXConverter:
             self.logger.info(f"Test 1 SUCCESS: {aax_file}")
 
         # Test with ffprobe
+        if await self._ffprobe_all(aax_file, decrypt_param) is None:
+            self.logger.error(f"ERROR: Invalid File: {aax_file}")
+            return False
+        elif self.args.validate:
+            self.logger.info(f"Test 2 SUCCESS: {aax_file}")
+
+        return True
+
+    async def validate_aax_file_full(self, aax_file: str, decrypt_param: List[str]) -> bool:
+        """Decode the whole audio stream of an AAX/AAXC file to check its integrity.
+
+        This costs as much as a transcode, so it only runs for --validate.
+        """
         try:
-            cmd = [self.ffprobe, '-loglevel', 'warning'] + decrypt_param + ['-i', os.path.abspath(aax_file)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd = [self.ffmpeg, '-hide_banner', '-nostats', '-loglevel', 'error'] + decrypt_param + \
+                self._fast_input_flags + ['-i', os.path.abspath(aax_file), '-vn', '-f', 'null', '-']
+            returncode, _, stderr = await self._run(cmd)
             
-            if result.returncode != 0:
+            if returncode != 0:
                 self.logger.error(f"ERROR: Invalid File: {aax_file}")
-                self.logger.debug(result.stderr)
+                self.logger.debug(stderr)
                 return False
-            elif self.args.validate:
-                self.logger.info(f"Test 2 SUCCESS: {aax_file}")
+            else:
+                self.logger.info(f"Test 3 SUCCESS: {aax_file}")
         except Exception as e:
-            self.logger.error(f"ERROR: Failed to validate {aax_file}: {e}")
+            self.logger.error(f"ERROR: Failed extended validation: {e}")
             return False
 
-        # Extended validation if --validate flag is set
-        if self.args.validate:
-            try:
-                cmd = [self.ffmpeg, '-hide_banner'] + decrypt_param + [
-                    '-i', os.path.abspath(aax_file), '-vn', '-f', 'null', '-'
-                ]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    self.logger.error(f"ERROR: Invalid File: {aax_file}")
-                    self.logger.debug(result.stderr)
-                    return False
-                else:
-                    self.logger.info(f"Test 3 SUCCESS: {aax_file}")
-            except Exception as e:
-                self.logger.error(f"ERROR: Failed extended validation: {e}")
-                return False
-
         return True
 
-    def get_metadata(self, aax_file: str, decrypt_param: List[str]) -> Dict[str, str]:
+    async def get_metadata(self, aax_file: str, decrypt_param: List[str]) -> Dict[str, str]:
         """Extract metadata from AAX/AAXC file."""
         metadata = {}
         
         # Get metadata from ffprobe
-        try:
-            cmd = [self.ffprobe] + decrypt_param + ['-i', os.path.abspath(aax_file)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            # Parse ffprobe output
-            if result.returncode != 0:
-                self.logger.error(f"ERROR: ffprobe failed to read metadata: {result.stderr}")
-                return {}
-            output = result.stdout + result.stderr
-            
-            # Extract metadata fields
-            patterns = {
-                'title': r'title\s*:\s*(.+)',
-                'artist': r'artist\s*:\s*(.+)',
-                'album': r'album\s*:\s*(.+)',
-                'album_artist': r'album_artist\s*:\s*(.+)',
-                'date': r'date\s*:\s*(.+)',
-                'genre': r'genre\s*:\s*(.+)',
-                'copyright': r'copyright\s*:\s*(.+)',
-            }
-            
-            for key, pattern in patterns.items():
-                match = re.search(pattern, output, re.IGNORECASE)
-                if match:
-                    metadata[key] = match.group(1).strip()
-                else:
-                    metadata[key] = ''
+        data = await self._ffprobe_all(aax_file, decrypt_param)
+        if data is None:
+            self.logger.error("ERROR: ffprobe failed to read metadata")
+            return {}
 
-            # Try to get bitrate
-            bitrate_match = re.search(r'bitrate:\s*(\d+)\s*kb/s', output, re.IGNORECASE)
-            if bitrate_match:
-                metadata['bitrate'] = bitrate_match.group(1)
+        try:
+            fmt = data.get('format', {})
+            # Tag names vary in case between muxers, so normalize them once
+            tags = {k.lower(): v for k, v in fmt.get('tags', {}).items()}
+            for key in _METADATA_TAGS:
+                metadata[key] = ''
+            # Every source tag is kept, so that tags such as the description
+            # in comment carry over to the output
+            for key, value in tags.items():
+                metadata[key] = str(value).strip()
+
+            # Bitrate is reported in bit/s
+            if fmt.get('bit_rate'):
+                metadata['bitrate'] = str(int(fmt['bit_rate']) // 1000)
             else:
                 metadata['bitrate'] = '64'
 
+            # Duration in seconds, used to report transcode progress
+            metadata['duration'] = fmt.get('duration', '0')
+
         except Exception as e:
             self.logger.error(f"ERROR: Failed to extract metadata: {e}")
             return {}
@@ -235,8 +475,7 @@ class AAXConverter:
         if self.has_mediainfo:
             try:
                 cmd = [self.mediainfo, os.path.abspath(aax_file)]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                output = result.stdout
+                _, output, _ = await self._run(cmd)
                 
                 # Extract narrator, publisher, description
                 narrator_match = re.search(r'Narrator\s*:\s*(.+)', output)
@@ -252,42 +491,51 @@ class AAXConverter:
 
         return metadata
 
-    def get_cover_art(self, aax_file: str, decrypt_param: List[str], output_dir: str) -> Optional[str]:
-        """Extract cover art from AAX/AAXC file."""
-        cover_file = os.path.join(output_dir, 'cover.jpg')
-        
+    async def get_cover_art(self, aax_file: str, decrypt_param: List[str]) -> Optional[str]:
+        """Extract cover art from AAX/AAXC file into a temporary file."""
+        # Books without an embedded picture need no ffmpeg run at all
+        data = await self._ffprobe_all(aax_file, decrypt_param)
+        if data is not None and not any(stream.get('codec_type') == 'video'
+                                        for stream in data.get('streams', [])):
+            return None
+
+        # The output directory depends on the metadata, which is read
+        # concurrently, so the cover goes to a temporary file instead
+        temp_fd = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
+        cover_file = temp_fd.name
+        temp_fd.close()  # Close so ffmpeg can write to it
+
         try:
-            cmd = [self.ffmpeg, '-loglevel', 'error'] + decrypt_param + [
-                '-i', os.path.abspath(aax_file), '-an', '-vcodec', 'copy', "-y", os.path.abspath(cover_file)
+            cmd = [self.ffmpeg, '-loglevel', 'error'] + decrypt_param + self._fast_input_flags + [
+                '-i', os.path.abspath(aax_file), '-an', '-vcodec', 'copy', "-y", cover_file
             ]
-            result = subprocess.run(cmd, capture_output=True)
+            returncode, _, _ = await self._run(cmd)
             
-            if result.returncode == 0 and os.path.isfile(cover_file):
+            if returncode == 0 and os.path.getsize(cover_file) > 0:
                 return cover_file
         except Exception as e:
             self.logger.debug(f"Failed to extract cover art: {e}")
         
+        if os.path.isfile(cover_file):
+            os.remove(cover_file)
         return None
 
-    def get_chapters(self, aax_file: str, decrypt_param: List[str]) -> List[Dict[str, str]]:
+    async def get_chapters(self, aax_file: str, decrypt_param: List[str]) -> List[Dict[str, str]]:
         """Extract chapter information from AAX/AAXC file."""
         chapters = []
         
+        data = await self._ffprobe_all(aax_file, decrypt_param)
+        if data is None:
+            return chapters
+
         try:
-            cmd = [self.ffprobe, '-i', os.path.abspath(aax_file), '-print_format', 'json',
-                   '-show_chapters', '-loglevel', 'error'] + decrypt_param
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                if 'chapters' in data:
-                    for i, chapter in enumerate(data['chapters']):
-                        chapters.append({
-                            'num': i + 1,
-                            'start': float(chapter.get('start_time', 0)),
-                            'end': float(chapter.get('end_time', 0)),
-                            'title': chapter.get('tags', {}).get('title', f'Chapter {i + 1}')
-                        })
+            for i, chapter in enumerate(data.get('chapters', [])):
+                chapters.append({
+                    'num': i + 1,
+                    'start': float(chapter.get('start_time', 0)),
+                    'end': float(chapter.get('end_time', 0)),
+                    'title': chapter.get('tags', {}).get('title', f'Chapter {i + 1}')
+                })
         except Exception as e:
             self.logger.debug(f"Failed to extract chapters: {e}")
         
@@ -295,24 +543,27 @@ class AAXConverter:
 
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize a filename by removing invalid characters."""
-        # Remove or replace characters that are invalid in filenames
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        # Replace characters that are invalid in filenames
+        filename = filename.translate(_SANITIZE_TABLE)
         # Remove leading/trailing spaces and dots
         filename = filename.strip('. ')
         # Limit length
         return filename[:255]
 
+    @staticmethod
+    def _compile_scheme(scheme: Optional[str]) -> Optional[string.Template]:
+        """Parse a naming scheme, or return None to use the default naming."""
+        return _NamingScheme(scheme) if scheme else None
+
     def get_output_directory(self, metadata: Dict[str, str]) -> str:
         """Determine the output directory based on naming scheme."""
-        if self.args.dir_naming_scheme:
+        if self._dir_template:
             # Custom directory naming scheme
-            scheme = self.args.dir_naming_scheme
-            scheme = scheme.replace('$genre', metadata.get('genre', 'Unknown'))
-            scheme = scheme.replace('$artist', metadata.get('artist', 'Unknown'))
-            scheme = scheme.replace('$title', metadata.get('title', 'Unknown'))
-            dir_name = scheme
+            dir_name = self._dir_template.safe_substitute(
+                genre=metadata.get('genre', 'Unknown'),
+                artist=metadata.get('artist', 'Unknown'),
+                title=metadata.get('title', 'Unknown'),
+            )
         else:
             # Default: genre/artist/title
             genre = metadata.get('genre', 'Unknown')
@@ -333,12 +584,12 @@ class AAXConverter:
 
     def get_output_filename(self, metadata: Dict[str, str]) -> str:
         """Determine the output filename based on naming scheme."""
-        if self.args.file_naming_scheme:
+        if self._file_template:
             # Custom file naming scheme
-            scheme = self.args.file_naming_scheme
-            scheme = scheme.replace('$title', metadata.get('title', 'Unknown'))
-            scheme = scheme.replace('$artist', metadata.get('artist', 'Unknown'))
-            filename = scheme
+            filename = self._file_template.safe_substitute(
+                title=metadata.get('title', 'Unknown'),
+                artist=metadata.get('artist', 'Unknown'),
+            )
         else:
             # Default: title
             filename = metadata.get('title', 'Unknown')
@@ -349,78 +600,79 @@ class AAXConverter:
                             chapter_title: str, total_chapters: int) -> str:
         """Determine the chapter filename based on naming scheme."""
         title = metadata.get('title', 'Unknown')
-        
-        if self.args.chapter_naming_scheme:
+        # Pad chapter numbers to the width of the highest one
+        chapter_num_str = str(chapter_num).zfill(len(str(total_chapters)))
+
+        if self._chapter_template:
             # Custom chapter naming scheme
-            scheme = self.args.chapter_naming_scheme
-            scheme = scheme.replace('$title', title)
-            scheme = scheme.replace('$chapter', chapter_title)
-            # Handle chapter number formatting
-            num_width = len(str(total_chapters))
-            chapter_num_str = str(chapter_num).zfill(num_width)
-            scheme = scheme.replace('$chapternum', chapter_num_str)
-            filename = scheme
+            filename = self._chapter_template.safe_substitute(
+                title=title, chapter=chapter_title, chapternum=chapter_num_str,
+            )
         else:
             # Default: Title-01 Chapter Name
-            num_width = len(str(total_chapters))
-            chapter_num_str = str(chapter_num).zfill(num_width)
             filename = f"{title}-{chapter_num_str} {chapter_title}"
 
         return self.sanitize_filename(filename)
 
+    def _write_ffmetadata(self, metadata: Dict[str, str],
+                          chapters: Optional[List[Dict[str, str]]] = None) -> str:
+        """Write book-level tags to a temporary ffmetadata file and return its path.
+
+        Passing this file as an extra input with -map_metadata keeps the ffmpeg
+        argv short instead of adding a -metadata pair per tag. Chapters given
+        here are written as chapter markers, for use with -map_chapters.
+        """
+        temp_fd = tempfile.NamedTemporaryFile('w', suffix='.ffmeta', encoding='utf-8', delete=False)
+        with temp_fd:
+            temp_fd.write(";FFMETADATA1\n")
+            for key, value in _output_tags(metadata):
+                temp_fd.write(f"{key.translate(_FFMETADATA_ESCAPES)}="
+                              f"{value.translate(_FFMETADATA_ESCAPES)}\n")
+            for chapter in chapters or ():
+                temp_fd.write(f"[CHAPTER]\nTIMEBASE=1/1000\n"
+                              f"START={round(chapter['start'] * 1000)}\n"
+                              f"END={round(chapter['end'] * 1000)}\n"
+                              f"title={chapter['title'].translate(_FFMETADATA_ESCAPES)}\n")
+        return temp_fd.name
+
+    def _transcode_command(self, aax_file: str, output_file: str, decrypt_param: List[str],
+                           tag_args: List[str]) -> List[str]:
+        """Build the ffmpeg command that converts a whole book."""
+        # Input, book-level tags, codec and quality settings, then container
+        # format and output file
+        return [
+            *self._ffmpeg_prefix,
+            *decrypt_param, *self._fast_input_flags, '-i', os.path.abspath(aax_file),
+            *tag_args,
+            *self._codec_args, *self._fmt_args, "-y", output_file,
+        ]
+
     def transcode_file(self, aax_file: str, output_file: str, decrypt_param: List[str],
                        metadata: Dict[str, str], cover_file: Optional[str] = None) -> bool:
         """Transcode AAX/AAXC file to output format."""
         self.logger.info(f"Transcoding {os.path.basename(aax_file)} to {self.extension}")
         
-        # Build ffmpeg command
-        cmd = [self.ffmpeg, '-nostats', '-loglevel', 'error'] + decrypt_param + [
-            '-i', os.path.abspath(aax_file)
-        ]
-
-        # Add codec and quality settings
-        if self.codec == 'copy':
-            cmd.extend(['-c:a', 'copy'])
-        else:
-            cmd.extend(['-c:a', self.codec])
-            if self.args.level > -1:
-                if self.codec == 'libmp3lame':
-                    cmd.extend(['-q:a', str(self.args.level)])
-                elif self.codec == 'flac':
-                    cmd.extend(['-compression_level', str(self.args.level)])
-                elif self.codec == 'libopus':
-                    cmd.extend(['-compression_level', str(self.args.level)])
-
-        # Add metadata
-        if metadata.get('title'):
-            cmd.extend(['-metadata', f"title={metadata['title']}"])
-        if metadata.get('artist'):
-            cmd.extend(['-metadata', f"artist={metadata['artist']}"])
-        if metadata.get('album'):
-            cmd.extend(['-metadata', f"album={metadata['album']}"])
-        if metadata.get('album_artist'):
-            cmd.extend(['-metadata', f"album_artist={metadata['album_artist']}"])
-        if metadata.get('date'):
-            cmd.extend(['-metadata', f"date={metadata['date']}"])
-        if metadata.get('genre'):
-            cmd.extend(['-metadata', f"genre={metadata['genre']}"])
-        if metadata.get('copyright'):
-            cmd.extend(['-metadata', f"copyright={metadata['copyright']}"])
-
-        # Set container format
-        cmd.extend(['-f', self.container])
-        
-        # Output file
-        cmd.extend(["-y", output_file])
+        ffmeta_file = self._write_ffmetadata(metadata)
+        cmd = self._transcode_command(aax_file, output_file, decrypt_param,
+                                      ['-i', ffmeta_file, '-map_metadata', '1'])
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                self.logger.error(f"ERROR: Transcoding failed: {result.stderr}")
-                return False
+            duration = float(metadata.get('duration') or 0)
+            if self.show_progress_bar and duration > 0:
+                returncode, stderr = self._run_with_progress(cmd, duration)
+                if returncode != 0:
+                    self.logger.error(f"ERROR: Transcoding failed: {stderr}")
+                    return False
+            else:
+                result = subprocess.run(cmd, **_QUIET, text=True)
+                if result.returncode != 0:
+                    self.logger.error(f"ERROR: Transcoding failed: {result.stderr}")
+                    return False
         except Exception as e:
             self.logger.error(f"ERROR: Transcoding failed: {e}")
             return False
+        finally:
+            os.remove(ffmeta_file)
 
         # Add cover art if available
         if cover_file and os.path.isfile(cover_file):
@@ -428,20 +680,142 @@ class AAXConverter:
 
         return True
 
+    def _existing_chapter_files(self, output_dir: str, metadata: Dict[str, str],
+                                chapters: List[Dict[str, str]]) -> Optional[List[str]]:
+        """Return the chapter files of a book if an earlier run finished all of them.
+
+        ffmpeg writes each chapter straight to its final name, so a file that
+        exists may have been cut short by an interrupted run. split_chapters
+        writes the playlist last and lists only the chapters that succeeded,
+        so the chapters count as finished when the playlist lists each of
+        them and is newer than all of them.
+        """
+        if not chapters:
+            return None
+
+        # One directory listing instead of a stat per chapter, which adds up
+        # for long books on network filesystems
+        try:
+            with os.scandir(output_dir) as entries:
+                existing = {entry.name: entry for entry in entries if entry.is_file()}
+        except OSError:
+            return None
+
+        playlist_file = self._playlist_path(output_dir, metadata)
+        playlist = existing.get(os.path.basename(playlist_file))
+        if playlist is None:
+            return None
+        try:
+            with open(playlist_file, encoding='utf-8') as pf:
+                listed = {line.rstrip('\n') for line in pf if not line.startswith('#')}
+            finished = playlist.stat().st_mtime
+            chapter_files = [self._chapter_output(output_dir, metadata, chapter, len(chapters))[1]
+                             for chapter in chapters]
+            for chapter_file in chapter_files:
+                name = os.path.basename(chapter_file)
+                if (name not in listed or name not in existing
+                        or existing[name].stat().st_mtime > finished):
+                    return None
+        except OSError:
+            return None
+        return chapter_files
+
+    def concat_chapters(self, chapter_files: List[str], output_file: str,
+                        metadata: Dict[str, str], chapters: List[Dict[str, str]]) -> bool:
+        """Join existing chapter files into a single file by stream copy."""
+        self.logger.info(f"Joining {len(chapter_files)} chapter files")
+
+        # The concat demuxer reads its inputs from a list file, in which
+        # quotes inside a path are written as '\''
+        temp_fd = tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False)
+        with temp_fd:
+            for chapter_file in chapter_files:
+                path = os.path.abspath(chapter_file).replace("'", "'\\''")
+                temp_fd.write(f"file '{path}'\n")
+        list_file = temp_fd.name
+        ffmeta_file = self._write_ffmetadata(metadata, chapters)
+
+        # The chapter titles and track numbers are replaced by the book tags,
+        # and the book's chapters are marked again, as in a transcoded file
+        cmd = [
+            *self._ffmpeg_prefix,
+            '-f', 'concat', '-safe', '0', '-i', list_file,
+            '-i', ffmeta_file, '-map_metadata', '1', '-map_chapters', '1',
+            '-map', '0:a', '-c:a', 'copy', *self._fmt_args, "-y", output_file,
+        ]
+
+        try:
+            result = subprocess.run(cmd, **_QUIET, text=True)
+            if result.returncode != 0:
+                self.logger.error(f"ERROR: Joining failed: {result.stderr}")
+                return False
+        except Exception as e:
+            self.logger.error(f"ERROR: Joining failed: {e}")
+            return False
+        finally:
+            os.remove(list_file)
+            os.remove(ffmeta_file)
+
+        return True
+
+    def _run_with_progress(self, cmd: List[str], duration: float) -> Tuple[int, str]:
+        """Run an ffmpeg command, driving the progress bar from its -progress output.
+
+        Returns the ffmpeg exit code and its error output.
+        """
+        cmd = [cmd[0], '-progress', 'pipe:1'] + cmd[1:]
+        total = max(1, int(duration))
+
+        # The pipes are read in binary, since text mode reads in 8 KiB chunks
+        # whatever the buffer size
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                bufsize=_PIPE_SIZE, **_SPAWN)
+        # Bigger pipes let ffmpeg keep writing while the progress bar is redrawn
+        # and, with the large read buffer, mean fewer, larger reads on this side
+        _grow_pipe(proc.stdout)
+        _grow_pipe(proc.stderr)
+        # Drain stderr alongside stdout so neither pipe can fill up and stall ffmpeg
+        errors = []
+
+        def drain_errors():
+            for chunk in iter(lambda: proc.stderr.read1(1 << 16), b''):
+                errors.append(chunk)
+
+        drain = threading.Thread(target=drain_errors, daemon=True)
+        drain.start()
+        with proc:
+            for line in proc.stdout:
+                # Despite its name, out_time_ms is in microseconds
+                key, _, value = line.strip().partition(b'=')
+                if key == b'out_time_ms' and value.isdigit():
+                    self.show_progress(min(total, int(value) // 1000000), total)
+            # Leaving the block closes the pipes, so collect the error output
+            # first; a run that fails at once has nothing but that output
+            drain.join()
+        print()  # End progress bar
+
+        return proc.returncode, b''.join(errors).decode('utf-8', errors='replace')
+
     def add_cover_art(self, audio_file: str, cover_file: str):
         """Add cover art to the output file."""
         self.logger.info("Adding cover art")
         
         if self.container == 'mp4':
             # Use mp4art for mp4 containers
-            if shutil.which(self.mp4art):
+            if self.has_mp4art:
                 try:
                     cmd = [self.mp4art, '--add', os.path.abspath(cover_file), os.path.abspath(audio_file)]
-                    subprocess.run(cmd, capture_output=True, check=True)
+                    subprocess.run(cmd, capture_output=True, check=True, **_SPAWN)
                 except Exception as e:
                     self.logger.debug(f"Failed to add cover art with {self.mp4art}: {e}")
+        elif _mutagen() is not None:
+            # Write the picture straight into the existing tags
+            try:
+                self._embed_cover_art(audio_file, cover_file)
+            except Exception as e:
+                self.logger.debug(f"Failed to add cover art with mutagen: {e}")
         else:
-            # Use ffmpeg for other containers
+            # Without mutagen, remux the file with ffmpeg to attach the cover
             # Create a secure temporary file using NamedTemporaryFile
             temp_file = None
             try:
@@ -454,7 +828,7 @@ class AAXConverter:
                 temp_fd.close()  # Close so ffmpeg can write to it
                 
                 cmd = [
-                    self.ffmpeg, '-loglevel', 'error', '-nostats',
+                    self.ffmpeg, '-loglevel', 'error', '-nostats', *self._fast_input_flags,
                     '-i', os.path.abspath(audio_file), '-i', os.path.abspath(cover_file),
                     '-map', '0:a:0', '-map', '1:v:0',
                     '-c:a', 'copy', '-c:v', 'copy',
@@ -463,7 +837,7 @@ class AAXConverter:
                     '-metadata:s:v', 'comment=Cover (front)', "-y",
                     temp_file
                 ]
-                result = subprocess.run(cmd, capture_output=True)
+                result = subprocess.run(cmd, **_QUIET)
                 if result.returncode == 0:
                     shutil.move(temp_file, audio_file)
                     temp_file = None  # File was moved successfully
@@ -478,98 +852,323 @@ class AAXConverter:
                         pass  # Failed to remove, but we tried
 
 
+    def _embed_cover_art(self, audio_file: str, cover_file: str):
+        """Embed a JPEG cover into an MP3, FLAC or Ogg Opus file in place with mutagen."""
+        mutagen = _mutagen()
+        with open(cover_file, 'rb') as f:
+            image = f.read()
+
+        if self.container == 'mp3':
+            try:
+                tags = mutagen.id3.ID3(audio_file)
+            except mutagen.id3.ID3NoHeaderError:
+                tags = mutagen.id3.ID3()
+            tags.delall('APIC')
+            tags.add(mutagen.id3.APIC(encoding=3, mime='image/jpeg', type=3,
+                                      desc='Cover (front)', data=image))
+            tags.save(audio_file, v2_version=3)
+            return
+
+        picture = mutagen.flac.Picture()
+        picture.type = 3  # Cover (front)
+        picture.mime = 'image/jpeg'
+        picture.desc = 'Cover (front)'
+        picture.data = image
+
+        if self.container == 'flac':
+            audio = mutagen.flac.FLAC(audio_file)
+            audio.clear_pictures()
+            audio.add_picture(picture)
+        else:
+            # Ogg files carry the FLAC picture block base64 encoded in a comment
+            audio = mutagen.oggopus.OggOpus(audio_file)
+            audio['metadata_block_picture'] = [base64.b64encode(picture.write()).decode('ascii')]
+        audio.save()
+
     def split_chapters(self, aax_file: str, output_dir: str, decrypt_param: List[str],
                       metadata: Dict[str, str], chapters: List[Dict[str, str]],
-                      cover_file: Optional[str] = None):
-        """Split AAX/AAXC file into chapters."""
+                      cover_file: Optional[str] = None, segments: Optional[List[str]] = None):
+        """Split a file already in the target codec into chapters by stream copy.
+
+        Segments already cut from the file by _segment_file can be passed in,
+        in which case they are only renamed and tagged.
+        """
         total_chapters = len(chapters)
         self.logger.info(f"Splitting into {total_chapters} chapters")
 
-        # Create playlist file
-        playlist_file = os.path.join(output_dir, f"{metadata.get('title', 'audiobook')}.m3u")
-        
-        with open(playlist_file, 'w', encoding='utf-8') as pf:
-            pf.write("#EXTM3U\n")
-            
-            for chapter in chapters:
-                chapter_num = chapter['num']
-                
-                # Skip chapters if continue option is used
-                if self.args.continue_at > 0 and chapter_num < self.args.continue_at:
-                    continue
-
-                chapter_title = chapter['title']
-                start_time = chapter['start']
-                end_time = chapter['end']
-                duration = end_time - start_time
-
-                # Get chapter filename
-                chapter_filename = self.get_chapter_filename(
-                    metadata, chapter_num, chapter_title, total_chapters
-                )
-                chapter_file = os.path.join(output_dir, f"{chapter_filename}.{self.extension}")
+        # Check for the cover once rather than in every chapter worker
+        if cover_file and not os.path.isfile(cover_file):
+            cover_file = None
+
+        # Skip chapters if continue option is used
+        if self.args.continue_at > 0:
+            chapters = [c for c in chapters if c['num'] >= self.args.continue_at]
+
+        if segments is None and self._can_segment(chapters):
+            segments = self._segment_file(aax_file, output_dir, decrypt_param, chapters)
+            if segments is None:
+                self.logger.warning("Segmenting failed, extracting chapters one at a time")
+
+        # Chapters are independent, so finish or extract them concurrently;
+        # each worker thread mostly waits on I/O or an ffmpeg subprocess
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.chapter_jobs) as executor:
+            if segments is not None:
+                futures = [
+                    executor.submit(self._finish_segment, segment_file, output_dir,
+                                    metadata, chapter, total_chapters, cover_file)
+                    for segment_file, chapter in zip(segments, chapters)
+                ]
+            else:
+                # Book-level tags are shared by every chapter, so write them once,
+                # and build every chapter's command line before starting any
+                ffmeta_file = self._write_ffmetadata(metadata)
+                tag_args = ['-i', ffmeta_file, '-map_metadata', '1']
+                jobs = [
+                    (chapter, *self._chapter_output(output_dir, metadata, chapter, total_chapters))
+                    for chapter in chapters
+                ]
+                futures = [
+                    executor.submit(self._extract_chapter,
+                                    self._chapter_command(aax_file, decrypt_param, chapter,
+                                                          tag_args, chapter_file),
+                                    metadata, chapter, chapter_filename, chapter_file, cover_file)
+                    for chapter, chapter_filename, chapter_file in jobs
+                ]
 
-                # Show progress
-                if self.args.loglevel < 2:
-                    self.show_progress(chapter_num, total_chapters)
+            # Show progress as chapters finish
+            for done, _ in enumerate(concurrent.futures.as_completed(futures), 1):
+                if self.show_progress_bar:
+                    self.show_progress(done, len(futures))
 
-                # Build ffmpeg command for chapter extraction
-                cmd = [self.ffmpeg, '-nostats', '-loglevel', 'error', "-y"] + decrypt_param + [
-                    '-i', os.path.abspath(aax_file) ]
-                
-                #declare mappings
-                cmd.extend(['-map', '0:a'])
+        if segments is None:
+            os.remove(ffmeta_file)
+
+        if self.show_progress_bar and futures:
+            print()  # End progress bar
 
-                # Set start and end times
-                cmd.extend(['-ss', str(start_time), '-to', str(end_time)])
+        # Create playlist file, keeping chapter order regardless of completion order.
+        # Workers hand back their errors rather than logging them, so failures
+        # are reported here in chapter order instead of across the progress bar.
+        playlist_file = self._playlist_path(output_dir, metadata)
 
-                # Add codec settings
-                if self.codec == 'copy':
-                    cmd.extend(['-c:a', 'copy'])
+        with open(playlist_file, 'w', encoding='utf-8') as pf:
+            pf.write("#EXTM3U\n")
+            for future in futures:
+                ok, result = future.result()
+                if ok:
+                    pf.write(result)
                 else:
-                    cmd.extend(['-c:a', self.codec])
-                    if self.args.level > -1:
-                        if self.codec == 'libmp3lame':
-                            cmd.extend(['-q:a', str(self.args.level)])
-                        elif self.codec == 'flac':
-                            cmd.extend(['-compression_level', str(self.args.level)])
-                        elif self.codec == 'libopus':
-                            cmd.extend(['-compression_level', str(self.args.level)])
-
-                # Remove chapter metadata
-                cmd.extend(['-map_chapters', '-1'])
-                
-                # Add metadata
-                cmd.extend([
-                    '-metadata', f"title={chapter_title}",
-                    '-metadata', f"track={chapter_num}",
-                ])
-                if metadata.get('artist'):
-                    cmd.extend(['-metadata', f"artist={metadata['artist']}"])
-                if metadata.get('album'):
-                    cmd.extend(['-metadata', f"album={metadata['album']}"])
-
-                # Set container format
-                cmd.extend(['-f', self.container, chapter_file])
+                    self.logger.error(result)
+
+    def _can_segment(self, chapters: List[Dict[str, str]]) -> bool:
+        """Return whether a book's chapters can be cut by a single segmenting run."""
+        # Segments can only be tagged per chapter afterwards with mutagen,
+        # and --continue needs only some of the chapters
+        return _mutagen() is not None and len(chapters) > 1 and self.args.continue_at <= 0
+
+    def _segment_file(self, aax_file: str, output_dir: str, decrypt_param: List[str],
+                      chapters: List[Dict[str, str]],
+                      codec_args: Tuple[str, ...] = ('-c:a', 'copy')) -> Optional[List[str]]:
+        """Cut a file at every chapter boundary with one ffmpeg run.
+
+        The audio is stream copied unless other codec arguments are given, in
+        which case the file is encoded and cut in the same pass. Returns the
+        segment files in chapter order, or None if segmenting failed.
+        """
+        segment_times = ','.join(str(c['end']) for c in chapters[:-1])
+        # The segment muxer expands printf patterns, so escape any '%' in the path
+        pattern = os.path.join(os.path.abspath(output_dir).replace('%', '%%'),
+                               f"segment_%03d.{self.extension}")
+        # ffmpeg lists every segment it wrote, which is checked against the chapters
+        temp_fd = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
+        segment_list = temp_fd.name
+        temp_fd.close()
+
+        cmd = [
+            *self._ffmpeg_prefix, "-y",
+            *decrypt_param, *self._fast_input_flags, '-i', os.path.abspath(aax_file),
+            '-map', '0:a', *codec_args, '-map_chapters', '-1',
+            '-f', 'segment', '-segment_format', self.container,
+            '-segment_list', segment_list, '-segment_list_type', 'csv',
+            '-segment_times', segment_times, '-reset_timestamps', '1', pattern,
+        ]
 
-                try:
-                    result = subprocess.run(cmd, capture_output=True)
-                    if result.returncode != 0:
-                        self.logger.error(f"Failed to create chapter {chapter_num}")
-                        continue
-                    # Add cover art if available
-                    if cover_file and os.path.isfile(cover_file):
-                        self.add_cover_art(chapter_file, cover_file)
-                except Exception as e:
-                    self.logger.error(f"Failed to create chapter {chapter_num}: {e}")
-                    continue
+        segments = None
+        try:
+            # Encoding takes as long as a transcode, so show its progress
+            duration = chapters[-1]['end']
+            if codec_args[1:2] != ('copy',) and self.show_progress_bar and duration > 0:
+                returncode, stderr = self._run_with_progress(cmd, duration)
+            else:
+                result = subprocess.run(cmd, **_QUIET, text=True)
+                returncode, stderr = result.returncode, result.stderr
+            if returncode == 0:
+                # Each row holds a segment's file name, relative to the list
+                with open(segment_list, newline='', encoding='utf-8') as lf:
+                    segments = [os.path.join(output_dir, os.path.basename(row[0]))
+                                for row in csv.reader(lf) if row]
+            else:
+                self.logger.debug(stderr)
+        except Exception as e:
+            self.logger.debug(f"Failed to segment {aax_file}: {e}")
+        finally:
+            os.remove(segment_list)
+
+        if segments is not None and len(segments) == len(chapters):
+            return segments
+
+        # Chapter boundaries past the end of the audio give fewer segments,
+        # which could not be matched to chapters reliably. A failed run lists
+        # none of its segments, or not the one it was writing, so remove every
+        # file that matches the pattern
+        segment_name = re.compile(rf'segment_\d{{3,}}\.{re.escape(self.extension)}')
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if segment_name.fullmatch(entry.name) and entry.is_file():
+                        os.remove(entry.path)
+        except OSError as e:
+            self.logger.debug(f"Failed to remove segments of {aax_file}: {e}")
+        return None
 
-                # Add to playlist
-                pf.write(f"#EXTINF:{int(duration)},{metadata.get('title', 'Unknown')} - {chapter_title}\n")
-                pf.write(f"{chapter_filename}.{self.extension}\n")
+    def _tag_file(self, audio_file: str, tags: Dict[str, str]):
+        """Write tags to an audio file in place with mutagen."""
+        audio = _mutagen().File(audio_file, easy=True)
+        if audio is None:
+            raise ValueError(f"unsupported file type: {audio_file}")
+        if audio.tags is None:
+            audio.add_tags()
+        for key, value in tags.items():
+            if value:
+                audio[key] = value
+        audio.save()
+
+    def _chapter_output(self, output_dir: str, metadata: Dict[str, str], chapter: Dict[str, str],
+                        total_chapters: int) -> Tuple[str, str]:
+        """Return the chapter filename (without extension) and the full output path."""
+        chapter_filename = self.get_chapter_filename(
+            metadata, chapter['num'], chapter['title'], total_chapters
+        )
+        return chapter_filename, os.path.join(output_dir, f"{chapter_filename}.{self.extension}")
+
+    def _playlist_path(self, output_dir: str, metadata: Dict[str, str]) -> str:
+        """Return the path of the M3U playlist written for chaptered output."""
+        return os.path.join(output_dir, f"{metadata.get('title', 'audiobook')}.m3u")
+
+    def _playlist_entry(self, metadata: Dict[str, str], chapter: Dict[str, str],
+                        chapter_filename: str) -> str:
+        """Build the M3U lines for a chapter file."""
+        duration = chapter['end'] - chapter['start']
+        return (f"#EXTINF:{int(duration)},{metadata.get('title', 'Unknown')} - {chapter['title']}\n"
+                f"{chapter_filename}.{self.extension}\n")
+
+    def _finish_segment(self, segment_file: str, output_dir: str, metadata: Dict[str, str],
+                        chapter: Dict[str, str], total_chapters: int,
+                        cover_file: Optional[str] = None) -> Tuple[bool, str]:
+        """Rename and tag a segment produced by _segment_file as a chapter file.
+
+        Returns success and the playlist entry, or the error message on failure.
+        """
+        chapter_num = chapter['num']
+        chapter_filename, chapter_file = self._chapter_output(output_dir, metadata, chapter, total_chapters)
 
-        if self.args.loglevel < 2:
-            print()  # End progress bar
+        try:
+            os.replace(segment_file, chapter_file)
+            self._tag_file(chapter_file, {
+                'title': chapter['title'],
+                'tracknumber': str(chapter_num),
+                'artist': metadata.get('artist'),
+                'album': metadata.get('album'),
+            })
+            # Add cover art if available
+            if cover_file:
+                self.add_cover_art(chapter_file, cover_file)
+        except Exception as e:
+            return False, f"Failed to create chapter {chapter_num}: {e}"
+
+        return True, self._playlist_entry(metadata, chapter, chapter_filename)
+
+    def _chapter_command(self, aax_file: str, decrypt_param: List[str], chapter: Dict[str, str],
+                         tag_args: List[str], chapter_file: str) -> List[str]:
+        """Build the ffmpeg command that cuts a single chapter out of a file."""
+        # Seeking on the input jumps straight to the chapter start rather than
+        # reading the file up to it, so late chapters cost no more than early
+        # ones, and fastseek lets the demuxer do that jump by index. Book-level
+        # tags come from tag_args. The input is already in
+        # the target codec, so the audio is only remuxed, with the source
+        # chapters dropped and the book title overridden.
+        duration = chapter['end'] - chapter['start']
+        return [
+            *self._ffmpeg_prefix, "-y",
+            *decrypt_param, *self._fast_input_flags, '-fflags', '+fastseek',
+            '-ss', str(chapter['start']), '-i', os.path.abspath(aax_file),
+            *tag_args,
+            '-map', '0:a', '-t', str(duration),
+            '-c:a', 'copy', '-avoid_negative_ts', 'make_zero',
+            '-map_chapters', '-1',
+            '-metadata', f"title={chapter['title']}",
+            '-metadata', f"track={chapter['num']}",
+            *self._fmt_args, chapter_file,
+        ]
+
+    def _extract_chapter(self, cmd: List[str], metadata: Dict[str, str], chapter: Dict[str, str],
+                         chapter_filename: str, chapter_file: str,
+                         cover_file: Optional[str] = None) -> Tuple[bool, str]:
+        """Run a chapter command and return its success and playlist entry or error."""
+        chapter_num = chapter['num']
+
+        try:
+            result = subprocess.run(cmd, **_QUIET, text=True)
+            if result.returncode != 0:
+                error = result.stderr.strip()
+                return False, f"Failed to create chapter {chapter_num}" + (f": {error}" if error else '')
+            # Add cover art if available
+            if cover_file:
+                self.add_cover_art(chapter_file, cover_file)
+        except Exception as e:
+            return False, f"Failed to create chapter {chapter_num}: {e}"
+
+        return True, self._playlist_entry(metadata, chapter, chapter_filename)
+
+    def print_commands(self, aax_file: str, output_dir: str, output_file: str,
+                       decrypt_param: List[str], metadata: Dict[str, str],
+                       chapters: List[Dict[str, str]], mode: str):
+        """Print the shell commands that convert a file, as one line per book.
+
+        The steps of a book are chained with &&, so the lines for several
+        books can be run in parallel by an external tool. Cover art, the
+        chapter playlist and mp4chaps chapters are not part of the commands.
+        Chapters are always cut with one ffmpeg run each, as in a conversion
+        without mutagen.
+        """
+        # Tags go on the command line so that nothing is written to disk.
+        # Newlines, as in a multi-line description, would survive quoting and
+        # break the book across lines, so they become spaces
+        tag_args = [arg for key, value in _output_tags(metadata)
+                    for arg in ('-metadata', f"{key}={' '.join(value.splitlines())}")]
+        steps = [['mkdir', '-p', output_dir]]
+
+        if mode == 'chaptered':
+            # Chapter numbers are padded to the whole book, as in split_chapters
+            total_chapters = len(chapters)
+            if self.args.continue_at > 0:
+                chapters = [c for c in chapters if c['num'] >= self.args.continue_at]
+            source, source_decrypt = aax_file, decrypt_param
+            if self.codec != 'copy':
+                # Encode once, then cut the chapters out of the result
+                source = os.path.join(output_dir, f"temp.{self.extension}")
+                source_decrypt = []
+                steps.append(self._transcode_command(aax_file, source, decrypt_param, tag_args))
+            for chapter in chapters:
+                _, chapter_file = self._chapter_output(output_dir, metadata, chapter, total_chapters)
+                steps.append(self._chapter_command(source, source_decrypt, chapter,
+                                                   tag_args, chapter_file))
+            if source != aax_file:
+                steps.append(['rm', '-f', source])
+        else:
+            steps.append(self._transcode_command(aax_file, output_file, decrypt_param, tag_args))
+
+        print(' && '.join(' '.join(shlex.quote(arg) for arg in step) for step in steps), flush=True)
 
     def show_progress(self, current: int, total: int):
         """Display a progress bar."""
@@ -579,7 +1178,90 @@ class AAXConverter:
         bar = '#' * filled + ' ' * (bar_length - filled)
         print(f'\rprocess: |{bar}| {percentage:3d}% ({current}/{total})', end='', flush=True)
 
-    def process_file(self, aax_file: str):
+    async def _encode_segments(self, loop: asyncio.AbstractEventLoop, aax_file: str, output_dir: str,
+                               decrypt_param: List[str], metadata: Dict[str, str],
+                               chapters: List[Dict[str, str]], cover_task: asyncio.Future) -> bool:
+        """Encode a book and cut it into chapters in a single ffmpeg run.
+
+        This reads and decrypts the source once and writes no intermediate
+        copy of the book. Returns False if segmenting failed.
+        """
+        self.logger.info(f"Transcoding {os.path.basename(aax_file)} to {self.extension}")
+        segments = await loop.run_in_executor(None, self._segment_file, aax_file, output_dir,
+                                              decrypt_param, chapters, self._codec_args)
+        if segments is None:
+            self.logger.warning("Segmenting failed, transcoding the whole book first")
+            return False
+
+        cover_file = await cover_task
+        self.split_chapters(aax_file, output_dir, decrypt_param, metadata, chapters,
+                            cover_file, segments=segments)
+        return True
+
+    async def _transcode_and_split(self, loop: asyncio.AbstractEventLoop, aax_file: str, output_dir: str,
+                                   decrypt_param: List[str], metadata: Dict[str, str],
+                                   chapters: List[Dict[str, str]], cover_task: asyncio.Future) -> bool:
+        """Encode a whole book to a temporary file, then cut the chapters out of it.
+
+        The chapters are cut by stream copy rather than re-encoding every
+        chapter. Returns False if the transcode failed.
+        """
+        temp_file = os.path.join(output_dir, f"temp.{self.extension}")
+        try:
+            if not await loop.run_in_executor(None, self.transcode_file, aax_file, temp_file,
+                                              decrypt_param, metadata):
+                self.logger.error("ERROR: Failed to transcode file")
+                return False
+            # The temporary file is already decrypted
+            cover_file = await cover_task
+            self.split_chapters(temp_file, output_dir, [], metadata, chapters, cover_file)
+        finally:
+            if os.path.isfile(temp_file):
+                os.remove(temp_file)
+        return True
+
+    def convert_file(self, aax_file: str):
+        """Convert a single AAX/AAXC file, running its pipeline on a fresh event loop."""
+        asyncio.run(self.process_file(aax_file))
+
+    def _cached_authcode(self, aax_file: str) -> Optional[str]:
+        """Return the authcode remembered for an AAX file, if any."""
+        authcode = _load_authcodes().get(_file_fingerprint(aax_file))
+        if authcode:
+            self.logger.debug(f"Using cached authcode for {aax_file}")
+        return authcode
+
+    def _remember_authcode(self, aax_file: str):
+        """Save the --authcode that decrypted an AAX file, for later runs without -A."""
+        if not self.args.authcode:
+            return
+        fingerprint = _file_fingerprint(aax_file)
+        if not fingerprint or _load_authcodes().get(fingerprint) == self.args.authcode:
+            return
+
+        cache_file = _authcode_cache_path()
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # Parallel workers take turns on a lock file and re-read the cache
+            # while holding it, so that no worker drops another's new entry.
+            # Without fcntl (Windows) the lock is skipped and an entry can be
+            # lost to a concurrent update, to be saved again by a later run
+            with open(cache_file + '.lock', 'a') as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                authcodes = _load_authcodes()
+                authcodes[fingerprint] = self.args.authcode
+                # Write a private temporary file and move it into place, so
+                # that readers never see a half-written cache
+                temp_fd = tempfile.NamedTemporaryFile('w', dir=os.path.dirname(cache_file),
+                                                      suffix='.tmp', encoding='utf-8', delete=False)
+                with temp_fd:
+                    json.dump(authcodes, temp_fd)
+                os.replace(temp_fd.name, cache_file)
+        except OSError as e:
+            self.logger.debug(f"Failed to save authcode cache {cache_file}: {e}")
+
+    async def process_file(self, aax_file: str):
         """Process a single AAX/AAXC file."""
         # Determine if file is AAXC
         is_aaxc = aax_file.lower().endswith('.aaxc')
@@ -596,7 +1278,7 @@ class AAXConverter:
             
             try:
                 with open(voucher_file, 'r', encoding='utf-8') as f:
-                    voucher_data = json.load(f)
+                    voucher_data = _json_loads(f.read())
                     key = voucher_data['content_license']['license_response']['key']
                     iv = voucher_data['content_license']['license_response']['iv']
                     decrypt_param = ['-audible_key', key, '-audible_iv', iv]
@@ -604,25 +1286,36 @@ class AAXConverter:
                 self.logger.error(f"ERROR: Failed to read voucher file: {e}")
                 return
         else:
-            # For AAX files, we need the activation bytes
-            if not self.args.authcode:
+            # For AAX files, we need the activation bytes, which may have
+            # been remembered from an earlier run on the same file
+            authcode = self.args.authcode or self._cached_authcode(aax_file)
+            if not authcode:
                 self.logger.error(f"ERROR: Missing authcode for {aax_file}")
                 return
-            decrypt_param = ['-activation_bytes', self.args.authcode]
+            decrypt_param = ['-activation_bytes', authcode]
 
         # Validate the file
-        if not self.validate_aax_file(aax_file, decrypt_param):
+        if not await self.validate_aax_file_fast(aax_file, decrypt_param):
             return
         
         if self.args.validate:
-            # If only validating, we're done
+            # If only validating, decode the whole file and we're done
+            if await self.validate_aax_file_full(aax_file, decrypt_param) and not is_aaxc:
+                self._remember_authcode(aax_file)
             return
 
-        # Extract metadata
-        metadata = self.get_metadata(aax_file, decrypt_param)
+        # Metadata and chapters are independent, so read them concurrently
+        metadata, chapters = await asyncio.gather(
+            self.get_metadata(aax_file, decrypt_param),
+            self.get_chapters(aax_file, decrypt_param),
+        )
         if not metadata:
             self.logger.error("ERROR: Failed to extract metadata")
             return
+        # ffmpeg rejects wrong activation bytes, so reading the file proved the
+        # authcode; a dry run leaves the cache alone like everything else
+        if not is_aaxc and not self.args.dry_run:
+            self._remember_authcode(aax_file)
 
         # Handle author override
         if self.args.author:
@@ -634,7 +1327,7 @@ class AAXConverter:
             if self.args.keep_author < len(artists):
                 author = artists[self.args.keep_author].strip()
                 # Remove extra spaces from initials like "C. S. Lewis" -> "C.S. Lewis"
-                author = re.sub(r'\.\s+', '.', author)
+                author = _INITIALS_RE.sub('.', author)
                 metadata['artist'] = author
                 metadata['album_artist'] = author
 
@@ -642,47 +1335,78 @@ class AAXConverter:
         if metadata.get('title'):
             metadata['title'] = metadata['title'][:128]
 
-        # Determine output directory
+        # Determine output directory and filename
         output_dir = self.get_output_directory(metadata)
-        
-        # Check for existing directory
-        if os.path.isdir(output_dir) and self.args.no_clobber:
-            self.logger.info(f"Skipping {aax_file} - output directory exists")
+        output_filename = self.get_output_filename(metadata)
+        output_file = os.path.join(output_dir, f"{output_filename}.{self.extension}")
+
+        # Decided per file, since a book without chapters falls back to single
+        mode = self.mode
+        if mode == 'chaptered' and not chapters:
+            self.logger.warning("No chapters found, creating single file")
+            mode = 'single'
+
+        # Check for existing output before any cover extraction or transcoding
+        if self.args.no_clobber:
+            expected = self._playlist_path(output_dir, metadata) if mode == 'chaptered' else output_file
+            if os.path.exists(expected):
+                self.logger.info(f"Skipping {aax_file} - {expected} exists")
+                return
+
+        if self.args.dry_run:
+            self.print_commands(aax_file, output_dir, output_file, decrypt_param, metadata, chapters, mode)
             return
+
         self.logger.info(f"Output Directory: {os.path.abspath(output_dir)}")
 
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
 
-        # Extract cover art
-        cover_file = self.get_cover_art(aax_file, decrypt_param, output_dir)
+        # Extract cover art in the background while the audio is transcoded;
+        # the transcode itself runs in a worker thread so the loop stays free
+        cover_task = asyncio.ensure_future(self.get_cover_art(aax_file, decrypt_param))
+        loop = asyncio.get_running_loop()
 
-        # Get output filename
-        output_filename = self.get_output_filename(metadata)
-
-        if self.mode == 'chaptered':
-            # Extract chapters
-            chapters = self.get_chapters(aax_file, decrypt_param)
-            
-            if chapters:
-                # Split into chapters directly from source
-                self.split_chapters(aax_file, output_dir, decrypt_param, 
-                                  metadata, chapters, cover_file)
-            else:
-                self.logger.warning("No chapters found, creating single file")
-                self.mode = 'single'
-
-        if self.mode == 'single':
-            # Create single output file
-            output_file = os.path.join(output_dir, f"{output_filename}.{self.extension}")
-            if not self.transcode_file(aax_file, output_file, decrypt_param, metadata, cover_file):
-                self.logger.error("ERROR: Failed to transcode file")
-                return
-
-            # Add chapters to m4b file if available
-            if self.container == 'mp4' and shutil.which(self.mp4chaps):
-                chapters = self.get_chapters(aax_file, decrypt_param)
-                if chapters:
+        try:
+            if mode == 'chaptered' and self.codec == 'copy':
+                # The source audio is kept as is, so cut the chapters straight
+                # out of the source without an intermediate copy of the book
+                cover_file = await cover_task
+                self.split_chapters(aax_file, output_dir, decrypt_param, metadata, chapters, cover_file)
+            elif mode == 'chaptered':
+                # Decrypt, encode and cut the book in one ffmpeg run when the
+                # segments can be tagged afterwards, otherwise in two passes
+                encoded = self._can_segment(chapters) and await self._encode_segments(
+                    loop, aax_file, output_dir, decrypt_param, metadata, chapters, cover_task)
+                if not encoded and not await self._transcode_and_split(
+                        loop, aax_file, output_dir, decrypt_param, metadata, chapters, cover_task):
+                    return
+
+            if mode == 'single':
+                # Chapters left by an earlier chaptered run are already in the
+                # target format, so join them instead of converting the book
+                # again. Only when the audio does not depend on --level: the
+                # earlier run may have used another one
+                chapter_files = (self.codec in ('copy', 'flac')
+                                 and self._existing_chapter_files(output_dir, metadata, chapters))
+                if chapter_files:
+                    if not await loop.run_in_executor(None, self.concat_chapters, chapter_files,
+                                                      output_file, metadata, chapters):
+                        self.logger.error("ERROR: Failed to join chapter files")
+                        return
+                # Create single output file
+                elif not await loop.run_in_executor(None, self.transcode_file, aax_file, output_file,
+                                                    decrypt_param, metadata):
+                    self.logger.error("ERROR: Failed to transcode file")
+                    return
+
+                # Add cover art if available
+                cover_file = await cover_task
+                if cover_file:
+                    self.add_cover_art(output_file, cover_file)
+
+                # Add chapters to m4b file if available
+                if self.container == 'mp4' and self.has_mp4chaps and chapters:
                     # Create chapters file for mp4chaps
                     # Note: This file is intentionally kept as part of the output
                     # for user reference, similar to the original bash script
@@ -697,13 +1421,15 @@ class AAXConverter:
                             cf.write(f"CHAPTER{chapter['num']:02d}NAME={chapter['title']}\n")
                     
                     try:
-                        subprocess.run([self.mp4chaps, '-i', os.path.abspath(output_file)], capture_output=True)
+                        subprocess.run([self.mp4chaps, '-i', os.path.abspath(output_file)],
+                                       capture_output=True, **_SPAWN)
                     except Exception as e:
                         self.logger.debug(f"Failed to add chapters: {e}")
-
-        # Clean up cover file
-        if cover_file and os.path.isfile(cover_file):
-            os.remove(cover_file)
+        finally:
+            # Clean up cover file, waiting for the extraction if a step failed first
+            cover_file = await cover_task
+            if cover_file and os.path.isfile(cover_file):
+                os.remove(cover_file)
 
         self.logger.info(f"Complete {metadata.get('title', 'Unknown')}")
 
@@ -715,12 +1441,41 @@ class AAXConverter:
 
     def run(self):
         """Run the converter on all input files."""
-        for aax_file in self.args.files:
-            self.process_file(aax_file)
+        if self.file_jobs == 1:
+            for aax_file in self.args.files:
+                self.convert_file(aax_file)
+            return
 
+        # Only needed to run files in parallel
+        import logging.handlers
+        import multiprocessing
 
-def main():
-    """Main entry point."""
+        # Workers send their log records back through a queue so lines from
+        # concurrently converted files are written whole by this process
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, *logging.getLogger().handlers)
+        listener.start()
+        try:
+            # Each worker builds its converter once from the plain options, so
+            # only file names are sent with every task rather than the converter
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.file_jobs,
+                initializer=_init_worker,
+                initargs=(log_queue, logging.getLogger().level, vars(self.args),
+                          {name: getattr(self, name) for name in self._TOOL_ATTRS})
+            ) as executor:
+                # Start the largest books first so a big one left for last
+                # does not keep the pool waiting on a single worker
+                files = sorted(self.args.files, key=_file_size, reverse=True)
+                # Consume the results so worker exceptions are raised here
+                list(executor.map(_convert_in_worker, files))
+        finally:
+            listener.stop()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser, once per process."""
     parser = argparse.ArgumentParser(
         description='Convert Audible AAX/AAXC files to various audio formats',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -768,7 +1523,7 @@ def main():
     output_group.add_argument('--chapter-naming-scheme', metavar='SCHEME',
                              help='Custom chapter naming scheme')
     output_group.add_argument('-n', '--no-clobber', action='store_true',
-                             help='Do not overwrite existing directories')
+                             help='Skip files whose output (file or chapter playlist) already exists')
     
     # Authentication options
     auth_group = parser.add_argument_group('authentication options')
@@ -785,7 +1540,7 @@ def main():
     # Validation options
     validation_group = parser.add_argument_group('validation options')
     validation_group.add_argument('-V', '--validate', action='store_true',
-                                 help='Validate AAX files only (no transcoding)')
+                                 help='Validate AAX files only (no transcoding); decodes each file in full')
     
     # Logging options
     logging_group = parser.add_argument_group('logging options')
@@ -796,6 +1551,11 @@ def main():
     
     # Advanced options
     advanced_group = parser.add_argument_group('advanced options')
+    advanced_group.add_argument('-j', '--jobs', type=int,
+                               default=max(1, (os.cpu_count() or 1) // 2), metavar='N',
+                               help='Number of parallel ffmpeg jobs (default: half the CPU cores)')
+    advanced_group.add_argument('--dry-run', action='store_true',
+                               help='Print the ffmpeg commands for each file instead of running them')
     advanced_group.add_argument('--continue', type=int, default=0, dest='continue_at',
                                metavar='CHAPTER',
                                help='Continue chapter splitting from chapter N')
@@ -822,8 +1582,13 @@ def main():
     parser.add_argument('files', nargs='+', metavar='FILE',
                        help='AAX/AAXC files to convert')
     
-    args = parser.parse_args()
-    
+    return parser
+
+
+def main():
+    """Main entry point."""
+    args = _build_parser().parse_args()
+
     # Create converter and run
     converter = AAXConverter(args)
     converter.run()